@@ -23,6 +23,9 @@ from .config import BONDED_SS_LIMIT, PEPTIDE_DIST, RNA_MAPPING
 
 _LOGGER = logging.getLogger(__name__)
 _LOGGER.addFilter(io.DuplicateFilter())
+_ATOM_RECORD_TYPES = (pdb.ATOM, pdb.HETATM)
+_STANDARD_RESIDUE_TYPES = (aa.Amino, na.Nucleic)
+_FF_NAMED_RESIDUE_TYPES = (aa.Amino, aa.WAT, na.Nucleic)
 
 
 class Biomolecule(object):
@@ -58,7 +61,7 @@ class Biomolecule(object):
             if isinstance(record, pdb.TER):
                 num_chains += 1
         for record in pdblist:
-            if isinstance(record, (pdb.ATOM, pdb.HETATM)):
+            if isinstance(record, _ATOM_RECORD_TYPES):
                 if record.chain_id == "":
                     if num_chains > 1 and record.res_name not in [
                         "WAT",
@@ -141,7 +144,7 @@ class Biomolecule(object):
         """
         natom = 0
         for residue in self.residues:
-            if not isinstance(residue, (aa.Amino, na.Nucleic)):
+            if not isinstance(residue, _STANDARD_RESIDUE_TYPES):
                 continue
             residue.missing = []
             for refatomname in residue.reference.map:
@@ -177,18 +180,16 @@ class Biomolecule(object):
         """
         natom = 0
         for residue in self.residues:
-            if not isinstance(residue, (aa.Amino, na.Nucleic)):
+            if not isinstance(residue, _STANDARD_RESIDUE_TYPES):
                 continue
-            for refatomname in residue.reference.map:
-                if refatomname.startswith("H"):
-                    continue
-                if refatomname in ["N+1", "C-1"]:
-                    continue
-                if refatomname == "O1P" and residue.has_atom("OP1"):
-                    continue
-                if refatomname == "O2P" and residue.has_atom("OP2"):
-                    continue
-                natom += 1
+            natom += sum(
+                1
+                for refatomname in residue.reference.map
+                if not refatomname.startswith("H")
+                and refatomname not in ("N+1", "C-1")
+                and not (refatomname == "O1P" and residue.has_atom("OP1"))
+                and not (refatomname == "O2P" and residue.has_atom("OP2"))
+            )
         return natom
 
     @property
@@ -286,8 +287,9 @@ class Biomolecule(object):
                     self.chains.insert(ch_num, newchain)
                     for res in reslist:
                         newchain.add_residue(res)
-                        chain.residues.remove(res)
                         res.set_chain_id(chainid[0])
+                    # reslist is always the leading run of chain.residues
+                    del chain.residues[: len(reslist)]
                     self.assign_termini(chain, neutraln, neutralc)
                     self.assign_termini(newchain, neutraln, neutralc)
                     reslist = []
@@ -333,7 +335,7 @@ class Biomolecule(object):
         See :mod:`aa` for residue-specific functions.
         """
         for residue in self.residues:
-            if isinstance(residue, (aa.Amino, na.Nucleic)):
+            if isinstance(residue, _STANDARD_RESIDUE_TYPES):
                 residue.set_state()
 
     def add_hydrogens(self, hlist=None):
@@ -347,7 +349,7 @@ class Biomolecule(object):
         """
         count = 0
         for residue in self.residues:
-            if not isinstance(residue, (aa.Amino, na.Nucleic)):
+            if not isinstance(residue, _STANDARD_RESIDUE_TYPES):
                 continue
 
             reskey = (residue.res_seq, residue.chain_id, residue.ins_code)
@@ -480,7 +482,7 @@ class Biomolecule(object):
     def remove_hydrogens(self):
         """Remove hydrogens from the biomolecule."""
         for residue in self.residues:
-            if not isinstance(residue, (aa.Amino, na.Nucleic)):
+            if not isinstance(residue, _STANDARD_RESIDUE_TYPES):
                 continue
             for atom in residue.atoms[:]:
                 if atom.is_hydrogen:
@@ -561,7 +563,7 @@ class Biomolecule(object):
         Update using the reference objects in each atom.
         """
         for residue in self.residues:
-            if isinstance(residue, (aa.Amino, aa.WAT, na.Nucleic)):
+            if isinstance(residue, _FF_NAMED_RESIDUE_TYPES):
                 for atom in residue.atoms:
                     if not atom.has_reference:
                         continue
@@ -723,7 +725,7 @@ class Biomolecule(object):
         misslist = []
         hitlist = []
         for residue in self.residues:
-            if isinstance(residue, (aa.Amino, aa.WAT, na.Nucleic)):
+            if isinstance(residue, _FF_NAMED_RESIDUE_TYPES):
                 resname = residue.ffname
             else:
                 resname = residue.name
@@ -739,7 +741,9 @@ class Biomolecule(object):
             charge_err = util.noninteger_charge(residue.charge)
             if charge_err:
                 _LOGGER.warning(
-                    f"Residue {residue} has non-integer charge: {charge_err}. "
+                    "Residue %s has non-integer charge: %s. ",
+                    residue,
+                    charge_err,
                 )
         return hitlist, misslist
 
@@ -750,7 +754,7 @@ class Biomolecule(object):
         :type forcefield_:  Forcefield
         """
         for residue in self.residues:
-            if isinstance(residue, (aa.Amino, aa.WAT, na.Nucleic)):
+            if isinstance(residue, _FF_NAMED_RESIDUE_TYPES):
                 resname = residue.ffname
             else:
                 resname = residue.name
@@ -1011,7 +1015,7 @@ class Biomolecule(object):
             _LOGGER.warning("No heavy atoms need to be repaired.")
             return
         for residue in self.residues:
-            if not isinstance(residue, (aa.Amino, na.Nucleic)):
+            if not isinstance(residue, _STANDARD_RESIDUE_TYPES):
                 continue
             atomlist = list(residue.atoms)
             for atom in atomlist:
@@ -1112,7 +1116,7 @@ class Biomolecule(object):
                 "CHARMM Atom Type</th></tr>\n"
             )
             for atom in self.atoms:
-                if isinstance(atom.residue, (aa.Amino, aa.WAT, na.Nucleic)):
+                if isinstance(atom.residue, _FF_NAMED_RESIDUE_TYPES):
                     resname = atom.residue.ffname
                 else:
                     resname = atom.residue.name
@@ -1146,8 +1150,7 @@ class Biomolecule(object):
         """
         atomlist = []
         for chain in self.chains:
-            for atom in chain.atoms:
-                atomlist.append(atom)
+            atomlist.extend(chain.atoms)
         return atomlist
 
     @property
@@ -4,6 +4,7 @@ import io
 
 # import argparse
 from collections import Counter
+from itertools import takewhile
 from pathlib import Path
 from sys import path as sys_path
 import requests
@@ -19,6 +20,74 @@ from .config import AA_DEF_PATH, NA_DEF_PATH, PATCH_DEF_PATH
 
 
 _LOGGER = logging.getLogger(__name__)
+_HEADER_TYPES = (
+    pdb.HEADER,
+    pdb.TITLE,
+    pdb.COMPND,
+    pdb.SOURCE,
+    pdb.KEYWDS,
+    pdb.EXPDTA,
+    pdb.AUTHOR,
+    pdb.REVDAT,
+    pdb.JRNL,
+    pdb.REMARK,
+    pdb.SPRSDE,
+    pdb.NUMMDL,
+)
+_PQR_HEADER_TEMPLATE = (
+    "REMARK   1 PQR file generated by PDB2PQR\n"
+    "REMARK   1 {title}\n"
+    "REMARK   1\n"
+    "REMARK   1 Forcefield Used: {force_field}\n"
+    "{naming}"
+    "REMARK   1\n"
+    "{pka}"
+    "{atom_warn}"
+    "{res_warn}"
+    "REMARK   6 Total charge on this biomolecule: {charge:.4f} e\n"
+    "REMARK   6\n"
+    "{old_header}"
+)
+_PQR_ATOM_WARNING_START = (
+    "REMARK   5 WARNING: PDB2PQR was unable to assign charges\n"
+    "REMARK   5 to the following atoms (omitted below):\n"
+)
+_PQR_ATOM_WARNING_END = (
+    "REMARK   5 This is usually due to the fact that this residue is not\n"
+    "REMARK   5 an amino acid or nucleic acid; or, there are no parameters\n"
+    "REMARK   5 available for the specific protonation state of this\n"
+    "REMARK   5 residue in the selected forcefield.\n"
+    "REMARK   5\n"
+)
+_PQR_RESIDUE_WARNING_START = (
+    "REMARK   5 WARNING: Non-integral net charges were found in\n"
+    "REMARK   5 the following residues:\n"
+)
+_CIF_PREAMBLE = (
+    "#\n"
+    "loop_\n"
+    "_pdbx_database_remark.id\n"
+    "_pdbx_database_remark.text\n"
+    "1\n"
+    ";\n"
+    "PQR file generated by PDB2PQR\n"
+    f"{TITLE_STR}\n"
+    "\n"
+)
+_CIF_COLUMN_HEADER = (
+    "#\n"
+    "loop_\n"
+    "_atom_site.group_PDB\n"
+    "_atom_site.id\n"
+    "_atom_site.label_atom_id\n"
+    "_atom_site.label_comp_id\n"
+    "_atom_site.label_seq_id\n"
+    "_atom_site.Cartn_x\n"
+    "_atom_site.Cartn_y\n"
+    "_atom_site.Cartn_z\n"
+    "_atom_site.pqr_partial_charge\n"
+    "_atom_site.pqr_radius\n"
+)
 
 
 class DuplicateFilter(logging.Filter):
@@ -46,15 +115,19 @@ class DuplicateFilter(logging.Filter):
         return True
 
 
-def print_biomolecule_atoms(atomlist, chainflag=False, pdbfile=False):
-    """Get PDB-format text lines for specified atoms.
+def iter_biomolecule_atoms(atomlist, chainflag=False, pdbfile=False):
+    """Generate PDB-format text lines for specified atoms.
+
+    Lines are produced lazily so large structures can be written without
+    holding every line in memory; atom serial numbers are assigned as the
+    lines are generated.
 
     :param [Atom] atomlist:  the list of atoms to include
     :param bool chainflag:  flag whether to print chainid or not
-    :return:  list of strings, each representing an atom PDB line
-    :rtype:  [str]
+    :param bool pdbfile:  flag whether to generate PDB rather than PQR lines
+    :return:  generator of strings, each representing an atom PDB line
+    :rtype:  Iterator[str]
     """
-    text = []
     currentchain_id = None
     for iatom, atom in enumerate(atomlist):
         # Print the "TER" records between chains
@@ -62,14 +135,25 @@ def print_biomolecule_atoms(atomlist, chainflag=False, pdbfile=False):
             currentchain_id = atom.chain_id
         elif atom.chain_id != currentchain_id:
             currentchain_id = atom.chain_id
-            text.append("TER\n")
+            yield "TER\n"
         atom.serial = iatom + 1
         if pdbfile is True:
-            text.append(f"{atom.get_pdb_string()}\n")
+            yield f"{atom.get_pdb_string()}\n"
         else:
-            text.append(f"{atom.get_pqr_string(chainflag=chainflag)}\n")
-    text.append("TER\nEND")
-    return text
+            yield f"{atom.get_pqr_string(chainflag=chainflag)}\n"
+    yield "TER\nEND"
+
+
+def print_biomolecule_atoms(atomlist, chainflag=False, pdbfile=False):
+    """Get PDB-format text lines for specified atoms.
+
+    :param [Atom] atomlist:  the list of atoms to include
+    :param bool chainflag:  flag whether to print chainid or not
+    :param bool pdbfile:  flag whether to generate PDB rather than PQR lines
+    :return:  list of strings, each representing an atom PDB line
+    :rtype:  [str]
+    """
+    return list(iter_biomolecule_atoms(atomlist, chainflag, pdbfile))
 
 
 def get_old_header(pdblist):
@@ -80,27 +164,12 @@ def get_old_header(pdblist):
     :return:  old header as string
     :rtype:  str
     """
-    old_header = io.StringIO()
-    header_types = (
-        pdb.HEADER,
-        pdb.TITLE,
-        pdb.COMPND,
-        pdb.SOURCE,
-        pdb.KEYWDS,
-        pdb.EXPDTA,
-        pdb.AUTHOR,
-        pdb.REVDAT,
-        pdb.JRNL,
-        pdb.REMARK,
-        pdb.SPRSDE,
-        pdb.NUMMDL,
+    headers = list(
+        takewhile(lambda pdb_obj: isinstance(pdb_obj, _HEADER_TYPES), pdblist)
     )
-    for pdb_obj in pdblist:
-        if not isinstance(pdb_obj, header_types):
-            break
-        old_header.write(str(pdb_obj))
-        old_header.write("\n")
-    return old_header.getvalue()
+    if not headers:
+        return ""
+    return "\n".join(map(str, headers)) + "\n"
 
 
 def print_pqr_header(
@@ -139,76 +208,55 @@ def print_pqr_header(
         force_field = "User force field"
     else:
         force_field = force_field.upper()
-    head = "\n".join(
-        [
-            "REMARK   1 PQR file generated by PDB2PQR",
-            f"REMARK   1 {TITLE_STR}",
-            "REMARK   1",
-            f"REMARK   1 Forcefield Used: {force_field}",
-            "",
-        ]
-    )
+    naming = ""
     if ffout is not None:
-        head += f"REMARK   1 Naming Scheme Used: {ffout}\n"
-    head += head + "REMARK   1\n"
+        naming = f"REMARK   1 Naming Scheme Used: {ffout}\n"
+    pka = ""
     if ph_calc_method is not None:
-        head += "\n".join(
-            [
-                f"REMARK   1 pKas calculated by {ph_calc_method} and "
-                f"assigned using pH {ph:.2f}\n"
-                "REMARK   1",
-                "",
-            ]
+        pka = (
+            f"REMARK   1 pKas calculated by {ph_calc_method} and "
+            f"assigned using pH {ph:.2f}\n"
+            "REMARK   1\n"
         )
+    atom_warn = ""
     if len(atomlist) != 0:
-        head += "\n".join(
-            [
-                "REMARK   5 WARNING: PDB2PQR was unable to assign charges",
-                "REMARK   5 to the following atoms (omitted below):",
-                "",
-            ]
-        )
+        lines = [_PQR_ATOM_WARNING_START]
         for atom in atomlist:
-            head += f"REMARK   5    {atom.serial} {atom.name} in "
-            head += f"{atom.residue.name} {atom.residue.res_seq}\n"
-        head += "\n".join(
-            [
-                "REMARK   5 This is usually due to the fact that this residue "
-                "is not",
-                "REMARK   5 an amino acid or nucleic acid; or, there are no "
-                "parameters",
-                "REMARK   5 available for the specific protonation state of "
-                "this",
-                "REMARK   5 residue in the selected forcefield.",
-                "REMARK   5",
-                "",
-            ]
-        )
+            residue = atom.residue
+            lines.append(
+                f"REMARK   5    {atom.serial} {atom.name} in "
+                f"{residue.name} {residue.res_seq}\n"
+            )
+        lines.append(_PQR_ATOM_WARNING_END)
+        atom_warn = "".join(lines)
+    res_warn = ""
     if len(reslist) != 0:
-        head += "\n".join(
-            [
-                "REMARK   5 WARNING: Non-integral net charges were found in",
-                "REMARK   5 the following residues:",
-                "",
-            ]
-        )
+        lines = [_PQR_RESIDUE_WARNING_START]
         for residue in reslist:
-            head += f"REMARK   5    {residue} - "
-            head += f"Residue Charge: {residue.charge:.4f}\n"
-        head += "REMARK   5\n"
-    head += "\n".join(
-        [
-            f"REMARK   6 Total charge on this biomolecule: {charge:.4f} e\n"
-            "REMARK   6",
-            "",
-        ]
-    )
+            lines.append(
+                f"REMARK   5    {residue} - "
+                f"Residue Charge: {residue.charge:.4f}\n"
+            )
+        lines.append("REMARK   5\n")
+        res_warn = "".join(lines)
+    old_header = ""
     if include_old_header:
-        head += "\n".join(
-            ["REMARK   7 Original PDB header follows", "REMARK   7", ""]
+        old_header = (
+            "REMARK   7 Original PDB header follows\n"
+            "REMARK   7\n" + get_old_header(pdblist)
         )
-        head += get_old_header(pdblist)
-    return head
+    return _PQR_HEADER_TEMPLATE.format_map(
+        {
+            "title": TITLE_STR,
+            "force_field": force_field,
+            "naming": naming,
+            "pka": pka,
+            "atom_warn": atom_warn,
+            "res_warn": res_warn,
+            "charge": charge,
+            "old_header": old_header,
+        }
+    )
 
 
 def print_pqr_header_cif(
@@ -244,88 +292,45 @@ def print_pqr_header_cif(
         force_field = "User force field"
     else:
         force_field = force_field.upper()
-
-    header = "\n".join(
-        [
-            "#",
-            "loop_",
-            "_pdbx_database_remark.id",
-            "_pdbx_database_remark.text",
-            "1",
-            ";",
-            "PQR file generated by PDB2PQR",
-            TITLE_STR,
-            "",
-            f"Forcefield used: {force_field}\n" "",
-        ]
-    )
+    header = io.StringIO()
+    write = header.write
+    write(_CIF_PREAMBLE)
+    write(f"Forcefield used: {force_field}\n")
     if ffout is not None:
-        header += f"Naming scheme used: {ffout}\n"
-    header += "\n"
+        write(f"Naming scheme used: {ffout}\n")
+    write("\n")
     if ph_calc_method is not None:
-        header += f"pKas calculated by {ph_calc_method} and "
-        header += f"assigned using pH {ph:.2f}\n"
-    header += "\n".join([";", "2", ";", ""])
-    if len(atomlist) > 0:
-        header += "\n".join(
-            [
-                "Warning: PDB2PQR was unable to assign charges",
-                "to the following atoms (omitted below):",
-                "",
-            ]
+        write(
+            f"pKas calculated by {ph_calc_method} and "
+            f"assigned using pH {ph:.2f}\n"
         )
+    write(";\n2\n;\n")
+    if len(atomlist) > 0:
+        write("Warning: PDB2PQR was unable to assign charges\n")
+        write("to the following atoms (omitted below):\n")
         for atom in atomlist:
-            header += f"    {atom.serial} {atom.name} in "
-            header += f"{atom.residue.name} {atom.residue.res_seq}\n"
-        header += "\n".join(
-            [
-                "This is usually due to the fact that this residue is not",
-                "an amino acid or nucleic acid; or, there are no parameters",
-                "available for the specific protonation state of this",
-                "residue in the selected forcefield.",
-                "",
-            ]
+            residue = atom.residue
+            write(
+                f"    {atom.serial} {atom.name} in "
+                f"{residue.name} {residue.res_seq}\n"
+            )
+        write(
+            "This is usually due to the fact that this residue is not\n"
+            "an amino acid or nucleic acid; or, there are no parameters\n"
+            "available for the specific protonation state of this\n"
+            "residue in the selected forcefield.\n"
         )
     if len(reslist) > 0:
-        header += "\n".join(
-            [
-                "Warning: Non-integral net charges were found in",
-                "the following residues:",
-                "",
-            ]
-        )
+        write("Warning: Non-integral net charges were found in\n")
+        write("the following residues:\n")
         for residue in reslist:
-            header += f"    {residue} - "
-            header += f"Residue Charge: {residue.charge:.4f}\n"
-    header += "\n".join(
-        [
-            ";",
-            "3",
-            ";",
-            f"Total charge on this biomolecule: {charge:.4f} e" ";",
-            "",
-        ]
-    )
+            write(f"    {residue} - Residue Charge: {residue.charge:.4f}\n")
+    write(";\n3\n;\n")
+    write(f"Total charge on this biomolecule: {charge:.4f} e;\n")
     if include_old_header:
         _LOGGER.warning("Including original CIF header not implemented.")
-    header += "\n".join(
-        [
-            "#",
-            "loop_",
-            "_atom_site.group_PDB",
-            "_atom_site.id",
-            "_atom_site.label_atom_id",
-            "_atom_site.label_comp_id",
-            "_atom_site.label_seq_id",
-            "_atom_site.Cartn_x",
-            "_atom_site.Cartn_y",
-            "_atom_site.Cartn_z",
-            "_atom_site.pqr_partial_charge",
-            "_atom_site.pqr_radius",
-            "",
-        ]
-    )
-    return header
+    write(_CIF_COLUMN_HEADER)
+    return header.getvalue()
 
 
 def dump_apbs(output_pqr, output_path):
@@ -23,6 +23,7 @@ from . import hydrogens
 from . import forcefield
 from . import biomolecule as biomol
 from . import io
+from . import pdb
 from .ligand.mol2 import Mol2Molecule
 from .utilities import noninteger_charge
 from .config import VERSION, TITLE_STR, CITATIONS, FORCE_FIELDS
@@ -30,6 +31,8 @@ from .config import REPAIR_LIMIT
 
 
 _LOGGER = logging.getLogger(f"PDB2PQR{VERSION}")
+_WATER_RECORD_TYPES = (pdb.HETATM, pdb.ATOM, pdb.SIGATM, pdb.SEQADV)
+_WATER_NAMES = frozenset(aa.WAT.water_residue_names)
 
 
 def build_main_parser():
@@ -299,7 +302,7 @@ def print_pqr(args, pqr_lines, header_lines, missing_lines, is_cif):
     .. todo::  Move this to another module (io)
 
     :param argparse.Namespace args:  command-line arguments
-    :param [str] pqr_lines:  output lines (records)
+    :param Iterable[str] pqr_lines:  output lines (records)
     :param [str] header_lines:  header lines
     :param [str] missing_lines:  lines describing missing atoms (should go
         in header)
@@ -342,7 +345,7 @@ def print_pdb(args, pdb_lines, header_lines, missing_lines, is_cif):
     .. todo::  Move this to another module (io)
 
     :param argparse.Namespace args:  command-line arguments
-    :param [str]] pdb_lines:  output lines (records)
+    :param Iterable[str] pdb_lines:  output lines (records)
     :param [str] header_lines:  header lines
     :param [str] missing_lines:  lines describing missing atoms (should go in
         header)
@@ -409,19 +412,21 @@ def setup_molecule(pdblist, definition, ligand_path):
         f"Created biomolecule object with {len(biomolecule.residues)} "
         f"residues and {len(biomolecule.atoms)} atoms."
     )
-    for residue in biomolecule.residues:
-        multoccupancy = False
-        for atom in residue.atoms:
-            if atom.alt_loc != "":
-                multoccupancy = True
-                txt = f"Multiple occupancies found: {atom.name} in {residue}."
-                _LOGGER.warning(txt)
-        if multoccupancy:
-            err = (
-                f"Multiple occupancies found in {residue}. At least one of "
-                "the instances is being ignored."
+    # The scan below only produces warnings; skip it if nobody is listening
+    if _LOGGER.isEnabledFor(logging.WARNING):
+        for residue in biomolecule.residues:
+            alt_atoms = [atom for atom in residue.atoms if atom.alt_loc != ""]
+            if not alt_atoms:
+                continue
+            for atom in alt_atoms:
+                _LOGGER.warning(
+                    "Multiple occupancies found: %s in %s.", atom.name, residue
+                )
+            _LOGGER.warning(
+                "Multiple occupancies found in %s. At least one of the "
+                "instances is being ignored.",
+                residue,
             )
-            _LOGGER.warning(err)
     return biomolecule, definition, ligand
 
 
@@ -482,16 +487,14 @@ def drop_water(pdblist):
     :return:  new list of PDB records with waters removed.
     :rtype:  [str]
     """
-    pdblist_new = []
-    for record in pdblist:
-        record_type = record.record_type()
-        if (
-            record_type in ["HETATM", "ATOM", "SIGATM", "SEQADV"]
-            and record.res_name in aa.WAT.water_residue_names
-        ):
-            continue
-        pdblist_new.append(record)
-    return pdblist_new
+    return [
+        record
+        for record in pdblist
+        if not (
+            isinstance(record, _WATER_RECORD_TYPES)
+            and record.res_name in _WATER_NAMES
+        )
+    ]
 
 
 def run_propka(args, biomolecule):
@@ -506,7 +509,7 @@ def run_propka(args, biomolecule):
     :rtype:  (list, str)
     """
 
-    lines = io.print_biomolecule_atoms(
+    lines = io.iter_biomolecule_atoms(
         atomlist=biomolecule.atoms, chainflag=args.keep_chain, pdbfile=True
     )
 
@@ -623,12 +626,22 @@ def non_trivial(args, biomolecule, ligand, definition, is_cif):
         _LOGGER.info("Updating disulfide bridges.")
         biomolecule.update_ss_bridges()
         if args.debump:
-            _LOGGER.info("Debumping biomolecule.")
-            try:
-                debumper.debump_biomolecule()
-            except ValueError as err:
-                err = f"Unable to debump biomolecule. {err}"
-                raise ValueError(err)
+            # Only rebuilt heavy atoms can bump before hydrogens are added
+            heavy_debump = any(
+                atom.added for atom in biomolecule.atoms
+            ) or any(
+                getattr(residue, "missing", None)
+                for residue in biomolecule.residues
+            )
+            if not heavy_debump:
+                _LOGGER.info("No rebuilt heavy atoms; deferring debumping.")
+            else:
+                _LOGGER.info("Debumping biomolecule.")
+                try:
+                    debumper.debump_biomolecule()
+                except ValueError as err:
+                    err = f"Unable to debump biomolecule. {err}"
+                    raise ValueError(err)
         if args.pka_method == "propka":
             _LOGGER.info("Assigning titration states with PROPKA.")
             biomolecule.remove_hydrogens()
@@ -670,34 +683,39 @@ def non_trivial(args, biomolecule, ligand, definition, is_cif):
         _LOGGER.info("Processing ligand.")
         _LOGGER.warning("Using ZAP9 forcefield for ligand radii.")
         ligand.assign_parameters()
+        mol2_atoms = ligand.atoms
         lig_atoms = []
         for residue in biomolecule.residues:
-            tot_charge = 0
             for pdb_atom in residue.atoms:
                 # Only check residues with HETATM
                 if pdb_atom.type == "ATOM":
                     break
                 try:
-                    mol2_atom = ligand.atoms[pdb_atom.name]
+                    mol2_atom = mol2_atoms[pdb_atom.name]
+                except KeyError:
+                    _LOGGER.warning(
+                        "Can't find HETATM %s %s %s in MOL2 file",
+                        residue.name,
+                        residue.res_seq,
+                        pdb_atom.name,
+                    )
+                else:
                     pdb_atom.radius = mol2_atom.radius
                     pdb_atom.ffcharge = mol2_atom.charge
-                    tot_charge += mol2_atom.charge
                     lig_atoms.append(pdb_atom)
-                except KeyError:
-                    err = (
-                        f"Can't find HETATM {residue.name} {residue.res_seq} "
-                        f"{pdb_atom.name} in MOL2 file"
-                    )
-                    _LOGGER.warning(err)
-                    missing_atoms.append(pdb_atom)
         matched_atoms += lig_atoms
+        # Ligand atoms parameterized from the MOL2 file are no longer missing
+        lig_atom_set = set(lig_atoms)
+        missing_atoms = [
+            atom for atom in missing_atoms if atom not in lig_atom_set
+        ]
     total_charge = 0
     for residue in biomolecule.residues:
         charge = residue.charge
         charge_err = noninteger_charge(charge)
         if charge_err:
             _LOGGER.warning(
-                f"Residue {residue} has non-integer charge:  {charge_err}"
+                "Residue %s has non-integer charge:  %s", residue, charge_err
             )
         total_charge += charge
     charge_err = noninteger_charge(total_charge)
@@ -810,7 +828,7 @@ def main_driver(args):
     if args.pdb_output:
         print_pdb(
             args=args,
-            pdb_lines=io.print_biomolecule_atoms(
+            pdb_lines=io.iter_biomolecule_atoms(
                 biomolecule.atoms, chainflag=args.keep_chain, pdbfile=True
             ),
             header_lines=results["header"],
@@ -81,14 +81,9 @@ class Residue(object):
         """Update the :makevar:`is_n_terms` and :makevar:`is_c_term` flags."""
         # If Nterm then update counter of hydrogens
         if self.is_n_term:
-            count = 0
-            atoms = ["H", "H2", "H3"]
-            for atom in atoms:
-                for atom2 in self.atoms:
-                    atomname = atom2.name
-                    if atom == atomname:
-                        count += 1
-            self.is_n_term = count
+            self.is_n_term = sum(
+                1 for atom in self.atoms if atom.name in ("H", "H2", "H3")
+            )
         # If Cterm then update counter
         if self.is_c_term:
             self.is_c_term = None
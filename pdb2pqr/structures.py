@@ -52,9 +52,7 @@ class Chain:
         """
         atomlist = []
         for residue in self.residues:
-            my_list = residue.atoms
-            for atom in my_list:
-                atomlist.append(atom)
+            atomlist.extend(residue.atoms)
         return atomlist
 
     def __str__(self):
@@ -149,9 +149,13 @@ def distance(coords1, coords2):
     :return:  distance between the two coordinates
     :rtype:  float
     """
-    coords1 = np.array(coords1)
-    coords2 = np.array(coords2)
-    return np.linalg.norm(coords1 - coords2)
+    # Called for every candidate atom pair during debumping and hydrogen
+    # optimization; plain float arithmetic avoids allocating numpy arrays
+    # for each 3-vector.
+    diff_x = coords1[0] - coords2[0]
+    diff_y = coords1[1] - coords2[1]
+    diff_z = coords1[2] - coords2[2]
+    return math.sqrt(diff_x * diff_x + diff_y * diff_y + diff_z * diff_z)
 
 
 def add(coords1, coords2):
@@ -1,7 +1,10 @@
 """Basic tests of simple core functionality."""
+from io import StringIO
 from pathlib import Path
 import pytest
 import common
+from pdb2pqr import pdb
+from pdb2pqr.main import drop_water
 
 # fmt: off
 #: Protein-nucleic acid complexes
@@ -142,3 +145,22 @@ def test_cyclic_peptide(input_pdb, expected_pqr, tmp_path):
         tmp_path=tmp_path,
         compare_resnames=True,
     )
+
+
+def test_drop_water():
+    """Test that waters are dropped regardless of atom serial width."""
+    # The 5-digit serial runs into the HETATM record name
+    pdb_text = (
+        "ATOM      1  N   ALA A   1      11.104   6.134  -6.504  1.00  0.00"
+        "           N\n"
+        "HETATM 9998  C1  TES A 325     -22.518  11.317  -0.948  1.00 30.63"
+        "           C\n"
+        "HETATM 9999  O   HOH A 401      -4.262  19.874   9.436  1.00 28.72"
+        "           O\n"
+        "HETATM10490  O   HOH A 402      -3.262  19.874   9.436  1.00 28.72"
+        "           O\n"
+    )
+    pdblist, _ = pdb.read_pdb(StringIO(pdb_text))
+    assert len(pdblist) == 4
+    remaining = [record.res_name for record in drop_water(pdblist)]
+    assert remaining == ["ALA", "TES"]
@@ -3,7 +3,14 @@ import logging
 from difflib import Differ
 from pathlib import Path
 import pytest
-from pdb2pqr.io import read_pqr, read_dx, write_cube, read_qcd
+from pdb2pqr.config import TITLE_STR
+from pdb2pqr.io import (
+    read_pqr,
+    read_dx,
+    write_cube,
+    read_qcd,
+    print_pqr_header,
+)
 
 
 _LOGGER = logging.getLogger(__name__)
@@ -35,6 +42,48 @@ def test_read_qcd():
         read_qcd(qcd_file)
 
 
+@pytest.mark.parametrize(
+    "force_field, label, ffout, ph_calc_method",
+    [
+        ("amber", "AMBER", None, None),
+        ("parse", "PARSE", "AMBER", None),
+        ("charmm", "CHARMM", None, "propka"),
+        (None, "User force field", "CHARMM", "propka"),
+    ],
+    ids=str,
+)
+def test_pqr_header_preamble(force_field, label, ffout, ph_calc_method):
+    """Test that :func:`print_pqr_header` writes its preamble only once.
+
+    :param force_field:  the forcefield name
+    :type force_field:  str
+    :param label:  expected force field label in the header
+    :type label:  str
+    :param ffout:  forcefield used for naming scheme
+    :type ffout:  str
+    :param ph_calc_method:  pKa calculation method
+    :type ph_calc_method:  str
+    """
+    header = print_pqr_header(
+        [], [], [], 0.0, force_field, ph_calc_method, 7.0, ffout
+    )
+    lines = header.splitlines()
+    preamble = [
+        "REMARK   1 PQR file generated by PDB2PQR",
+        f"REMARK   1 {TITLE_STR}",
+        f"REMARK   1 Forcefield Used: {label}",
+    ]
+    if ffout is not None:
+        preamble.append(f"REMARK   1 Naming Scheme Used: {ffout}")
+    if ph_calc_method is not None:
+        preamble.append(
+            f"REMARK   1 pKas calculated by {ph_calc_method} and "
+            "assigned using pH 7.00"
+        )
+    for line in preamble:
+        assert lines.count(line) == 1, f"{line!r} in header:\n{header}"
+
+
 def test_dx2cube(tmp_path):
     """Test conversion of OpenDX files to Cube files."""
     pqr_path = DATA_DIR / "dx2cube.pqr"
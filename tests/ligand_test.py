@@ -6,6 +6,7 @@ import pytest
 import pandas as pd
 from numpy.testing import assert_almost_equal
 from pdb2pqr.ligand.mol2 import Mol2Molecule
+from pdb2pqr.main import main_driver
 import common
 from ligand_results import TORSION_RESULTS, RING_RESULTS, CHARGES_1HPX
 from ligand_results import FORMAL_CHARGE_RESULTS, PARAMETER_RESULTS
@@ -187,3 +188,52 @@ def test_ligand_biomolecule(input_pdb, tmp_path):
         output_pqr=output_pqr,
         tmp_path=tmp_path,
     )
+
+
+def test_ligand_missing_atoms(tmp_path):
+    """Test that MOL2-parameterized HETATMs are not reported as missing."""
+    mol2_path = Path("tests/data/1AFS-ligand.mol2")
+    ligand = Mol2Molecule()
+    with open(mol2_path, "rt") as mol2_file:
+        ligand.read(mol2_file)
+    # Keep the protein, the waters, and a single testosterone (TES A 325)
+    # completed with the hydrogens from the MOL2 file
+    hydrogen_lines = [
+        (
+            f"HETATM{9000 + iatom:5d} {atom.name:<4s} TES A 325    "
+            f"{atom.x:8.3f}{atom.y:8.3f}{atom.z:8.3f}  1.00  0.00"
+            "           H\n"
+        )
+        for iatom, atom in enumerate(ligand.atoms.values())
+        if atom.type == "H"
+    ]
+    pdb_lines = []
+    with open(Path("tests/data/1AFS.pdb"), "rt") as pdb_file:
+        for line in pdb_file:
+            if line.startswith("HETATM"):
+                res_name, chain_id = line[17:20], line[21]
+                if res_name == "NAP" or (res_name, chain_id) == ("TES", "B"):
+                    continue
+            pdb_lines.append(line)
+            # C19 is the last TES heavy atom in the PDB file
+            if line.startswith("HETATM") and line[12:20] == " C19 TES":
+                pdb_lines += hydrogen_lines
+    input_pdb = tmp_path / "1AFS-TES.pdb"
+    input_pdb.write_text("".join(pdb_lines))
+    output_pqr = tmp_path / "1AFS-TES.pqr"
+    args = common.PARSER.parse_args(
+        [
+            "--log-level=INFO",
+            "--ff=AMBER",
+            f"--ligand={mol2_path}",
+            str(input_pdb),
+            str(output_pqr),
+        ]
+    )
+    missing_atoms, _, biomolecule = main_driver(args)
+    residue_names = {residue.name for residue in biomolecule.residues}
+    assert {"TES", "HOH"} <= residue_names
+    missing = [
+        f"{atom.res_name} {atom.res_seq} {atom.name}" for atom in missing_atoms
+    ]
+    assert not missing, f"Unexpected missing atoms: {missing}"
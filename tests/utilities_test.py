@@ -0,0 +1,33 @@
+"""Tests of utility functions."""
+import numpy as np
+import pytest
+from numpy.testing import assert_array_max_ulp
+from pdb2pqr.utilities import distance
+
+
+_RNG = np.random.default_rng(1234)
+COORD_PAIRS = [
+    ([0.0, 0.0, 0.0], [0.0, 0.0, 0.0]),
+    ([0.0, 0.0, 0.0], [1.0, 0.0, 0.0]),
+    ([-22.518, 11.317, -0.948], [-22.476, 12.848, -1.023]),
+    ([-18.934, 65.420, -20.556], [-22.518, 11.317, -0.948]),
+] + [tuple(_RNG.uniform(-100.0, 100.0, (2, 3)).tolist()) for _ in range(16)]
+
+
+@pytest.mark.parametrize("coords1, coords2", COORD_PAIRS)
+def test_distance(coords1, coords2):
+    """Test :func:`distance` against :func:`numpy.linalg.norm`.
+
+    Results may differ in the last bit since numpy may use fused
+    multiply-add instructions.
+
+    :param coords1:  first set of coordinates
+    :type coords1:  list
+    :param coords2:  second set of coordinates
+    :type coords2:  list
+    """
+    expected = np.linalg.norm(np.array(coords1) - np.array(coords2))
+    assert_array_max_ulp(distance(coords1, coords2), expected, maxulp=2)
+    assert_array_max_ulp(
+        distance(np.array(coords1), np.array(coords2)), expected, maxulp=2
+    )